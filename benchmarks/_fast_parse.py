@@ -0,0 +1,64 @@
+"""Bulk extraction of <FINAL_ANSWER> spans from LLM outputs.
+
+When numba (and numpy) are installed, tag search runs as a compiled byte
+scan that releases the interpreter from per-character work; otherwise the
+precompiled-regex path is used. Both paths return the text between the
+first <FINAL_ANSWER> and </FINAL_ANSWER> pair, or "" when the tags are
+missing, matching parse_result in the HumanEval driver.
+"""
+import re
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+_FINAL_ANSWER_RE = re.compile(r"<FINAL_ANSWER>([\s\S]*?)</FINAL_ANSWER>")
+_START_TAG = b"<FINAL_ANSWER>"
+_END_TAG = b"</FINAL_ANSWER>"
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _find_sub(buf, pattern, start):
+        n = buf.shape[0]
+        m = pattern.shape[0]
+        for i in range(start, n - m + 1):
+            hit = True
+            for j in range(m):
+                if buf[i + j] != pattern[j]:
+                    hit = False
+                    break
+            if hit:
+                return i
+        return -1
+
+    _START = np.frombuffer(_START_TAG, dtype=np.uint8)
+    _END = np.frombuffer(_END_TAG, dtype=np.uint8)
+
+    def _extract_one(result: str) -> str:
+        data = result.encode("utf-8")
+        buf = np.frombuffer(data, dtype=np.uint8)
+        start = _find_sub(buf, _START, 0)
+        if start == -1:
+            return ""
+        begin = start + len(_START_TAG)
+        end = _find_sub(buf, _END, begin)
+        if end == -1:
+            return ""
+        return data[begin:end].decode("utf-8")
+
+else:
+
+    def _extract_one(result: str) -> str:
+        match = _FINAL_ANSWER_RE.search(result)
+        return match.group(1) if match else ""
+
+
+def extract_final_answers(results: List[str]) -> List[str]:
+    """Extract the <FINAL_ANSWER> span from each output, in order."""
+    return [_extract_one(result) for result in results]
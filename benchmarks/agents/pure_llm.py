@@ -1,39 +1,24 @@
-from cerebrum.llm.apis import llm_chat
+from typing import List
 
-from litellm import completion
+from cerebrum.llm.apis import (
+    llm_chat,
+    llm_chat_batch,
+    allm_chat,
+    llm_chat_with_json_output,
+    allm_chat_with_json_output,
+)
 
-class PureLLM:
-    def __init__(self, on_aios: bool = True):
-        self.agent_name = "llm"
-        self.on_aios = on_aios
+from litellm import completion, batch_completion, acompletion
 
-    def run_swebench(self, input_str: str):
-        messages = [
-            {"content": "You are a helpful assistant that can answer questions and help with tasks.", "role": "system"},
-            {"content": input_str, "role": "user"}
-        ]
-        if self.on_aios:
-            response = llm_chat(self.agent_name, messages)
-        else:
-            response = completion(
-                model="gpt-4o-mini",
-                messages=messages,
-                temperature=0.0,
-            )
-        result = response["response"]["response_message"]
-        
-        return result
-    
-    def run_humaneval(self, input_str: str):
-        system_prompt = """You are an AI assistant good at coding. You will receive a function definition and
+HUMANEVAL_SYSTEM_PROMPT = """You are an AI assistant good at coding. You will receive a function definition and
         comments. You need to help me complete this function. The completion should strictly follow the following format and requirements:
-        
+
         Format:
         <FINAL_ANSWER>
         YOUR FINAL ANSWER
         </FINAL_ANSWER>
-        
-        Requirements: 
+
+        Requirements:
         1. YOUR FINAL ANSWER must be a piece of code that can be directly filled into the given code at the <CURRENT_CURSOR_POSITION> marker.
         2. Only include the code you're adding, don't include the original function definition or comments.
         3. Do not use extra code quotes like ```python``` to wrap the code.
@@ -42,7 +27,7 @@ class PureLLM:
         6. If you're completing a function body, ensure all code is properly indented inside the function.
         7. Check that all return statements, loops, and conditional blocks have correct indentation.
         8. Ensure your code aligns with the original code style and indentation pattern.
-        
+
         Example of proper formatting:
         For a function like:
         ```
@@ -50,19 +35,76 @@ class PureLLM:
             # Some comment
             # More comments
         ```
-        
+
         Your answer should be:
         <FINAL_ANSWER>
             result = x * 2
             return result
         </FINAL_ANSWER>
-        
+
         Notice how the code maintains proper indentation relative to the function definition.
         """
+
+HUMANEVAL_JSON_SYSTEM_PROMPT = """You are an AI assistant good at coding. You will receive a function definition and
+        comments. You need to help me complete this function. Respond with a JSON object of the form {"code": "..."} where
+        the value of "code" is the completion to be filled in at the <CURRENT_CURSOR_POSITION> marker.
+
+        Requirements:
+        1. Only include the code you're adding, don't include the original function definition or comments.
+        2. Do not use extra code quotes like ```python``` to wrap the code.
+        3. Make sure the syntax of the code is correct, especially pay attention to proper indentation.
+        4. Maintain the same indentation level as the surrounding code.
+        """
+
+HUMANEVAL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "completion",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "code": {"type": "string"}
+            },
+            "required": ["code"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+}
+
+HUMANEVAL_RESPONSE_SCHEMA = HUMANEVAL_RESPONSE_FORMAT["json_schema"]["schema"]
+
+
+class PureLLM:
+    def __init__(self, on_aios: bool = True):
+        self.agent_name = "llm"
+        self.on_aios = on_aios
+
+    def run_swebench(self, input_str: str):
         messages = [
-            {"content": system_prompt, "role": "system"},
+            {"content": "You are a helpful assistant that can answer questions and help with tasks.", "role": "system"},
+            {"content": input_str, "role": "user"}
+        ]
+        if self.on_aios:
+            response = llm_chat(self.agent_name, messages)
+        else:
+            response = completion(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.0,
+            )
+        result = response["response"]["response_message"]
+        
+        return result
+    
+    def _humaneval_messages(self, input_str: str):
+        return [
+            {"content": HUMANEVAL_SYSTEM_PROMPT, "role": "system"},
             {"content": f"Given the following code: {input_str}, complete the function. ", "role": "user"}
         ]
+
+    def run_humaneval(self, input_str: str):
+        messages = self._humaneval_messages(input_str)
         if self.on_aios:
             response = llm_chat(self.agent_name, messages)
             result = response["response"]["response_message"]
@@ -73,7 +115,81 @@ class PureLLM:
                 temperature=1.0,
             )
         return result
-    
+
+    def _humaneval_json_messages(self, input_str: str):
+        return [
+            {"content": HUMANEVAL_JSON_SYSTEM_PROMPT, "role": "system"},
+            {"content": f"Given the following code: {input_str}, complete the function. ", "role": "user"}
+        ]
+
+    def run_humaneval_json(self, input_str: str):
+        messages = self._humaneval_json_messages(input_str)
+        if self.on_aios:
+            response = llm_chat_with_json_output(
+                self.agent_name,
+                messages,
+                response_format=HUMANEVAL_RESPONSE_FORMAT,
+                response_schema=HUMANEVAL_RESPONSE_SCHEMA,
+            )
+            result = response["response"]["response_message"]
+        else:
+            response = completion(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=1.0,
+                response_format=HUMANEVAL_RESPONSE_FORMAT,
+            )
+            result = response.choices[0].message.content
+        return result
+
+    async def arun_humaneval_json(self, input_str: str):
+        messages = self._humaneval_json_messages(input_str)
+        if self.on_aios:
+            response = await allm_chat_with_json_output(
+                self.agent_name,
+                messages,
+                response_format=HUMANEVAL_RESPONSE_FORMAT,
+                response_schema=HUMANEVAL_RESPONSE_SCHEMA,
+            )
+            result = response["response"]["response_message"]
+        else:
+            response = await acompletion(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=1.0,
+                response_format=HUMANEVAL_RESPONSE_FORMAT,
+            )
+            result = response.choices[0].message.content
+        return result
+
+    async def arun_humaneval(self, input_str: str):
+        messages = self._humaneval_messages(input_str)
+        if self.on_aios:
+            response = await allm_chat(self.agent_name, messages)
+            result = response["response"]["response_message"]
+        else:
+            response = await acompletion(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=1.0,
+            )
+            result = response.choices[0].message.content
+        return result
+
+    def run_humaneval_batch(self, input_strs: List[str]):
+        messages_batch = [self._humaneval_messages(input_str) for input_str in input_strs]
+        if self.on_aios:
+            responses = llm_chat_batch(self.agent_name, messages_batch)
+            results = [response["response"]["response_message"] for response in responses["responses"]]
+        else:
+            responses = batch_completion(
+                model="gpt-4o-mini",
+                messages=messages_batch,
+                temperature=1.0,
+            )
+            results = [response.choices[0].message.content for response in responses]
+        return results
+
     def run_gaia(self, input_str: str):
         messages = [
             {"content": f"Given the following code: {input_str}, please provide the completion of the code to fulfill the functionality.", "role": "user"}
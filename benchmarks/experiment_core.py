@@ -1,3 +1,6 @@
+import asyncio
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Callable
 
 from pydantic.v1 import BaseModel
@@ -12,6 +15,17 @@ AGENT_TYPE_MAPPING_AIOS = {
 }
 
 
+@lru_cache(maxsize=None)
+def get_agent(agent_type: str, on_aios: bool):
+    """Return a process-wide agent instance for (agent_type, on_aios).
+
+    Agents are stateless across samples, so building one per sample only
+    repeats construction overhead; the first call per configuration builds
+    the agent and later calls reuse it.
+    """
+    return AGENT_TYPE_MAPPING_AIOS[agent_type](on_aios)
+
+
 class MetaData(BaseModel):
     dataset: Any
     split: str = None
@@ -19,6 +33,7 @@ class MetaData(BaseModel):
     output_file: str
     on_aios: bool = True
     max_num: int = None
+    structured: bool = False
 
 
 def run(process_one_func, meta_data: MetaData, write_output_func=None):
@@ -44,8 +59,74 @@ def run(process_one_func, meta_data: MetaData, write_output_func=None):
     return total_result
 
 
-def run_inference(meta_data: MetaData, process_one_func: Callable, write_output_func: Callable = None):
-    run(
+def run_batch(process_batch_func, meta_data: MetaData, write_output_func=None, batch_size: int = 32):
+    total_result = []
+    if meta_data.split:
+        dataset = meta_data.dataset[meta_data.split]
+    else:
+        dataset = meta_data.dataset
+
+    iterator = iter(dataset)
+    if meta_data.max_num is not None:
+        iterator = islice(iterator, meta_data.max_num)
+
+    with tqdm() as pbar:
+        while True:
+            data_batch = list(islice(iterator, batch_size))
+            if not data_batch:
+                break
+            results = process_batch_func(data_batch, meta_data)
+            total_result.extend(results)
+            pbar.update(len(data_batch))
+
+    if write_output_func:
+        write_output_func(total_result, meta_data.output_file)
+    return total_result
+
+
+async def run_async(process_one_async, meta_data: MetaData, write_output_func=None, concurrency: int = 16):
+    if meta_data.split:
+        dataset = meta_data.dataset[meta_data.split]
+    else:
+        dataset = meta_data.dataset
+
+    iterator = iter(dataset)
+    if meta_data.max_num is not None:
+        iterator = islice(iterator, meta_data.max_num)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process_guarded(data):
+        async with semaphore:
+            return await process_one_async(data, meta_data)
+
+    total_result = list(await asyncio.gather(*[process_guarded(data) for data in iterator]))
+
+    if write_output_func:
+        write_output_func(total_result, meta_data.output_file)
+    return total_result
+
+
+def run_inference_async(meta_data: MetaData, process_one_async: Callable, write_output_func: Callable = None,
+                        concurrency: int = 16):
+    return asyncio.run(run_async(
+        process_one_async=process_one_async,
+        meta_data=meta_data,
+        write_output_func=write_output_func,
+        concurrency=concurrency,
+    ))
+
+
+def run_inference(meta_data: MetaData, process_one_func: Callable = None, write_output_func: Callable = None,
+                  process_batch_func: Callable = None, batch_size: int = 32):
+    if process_batch_func is not None:
+        return run_batch(
+            process_batch_func=process_batch_func,
+            meta_data=meta_data,
+            write_output_func=write_output_func,
+            batch_size=batch_size,
+        )
+    return run(
         process_one_func=process_one_func,
         meta_data=meta_data,
         write_output_func=write_output_func,
@@ -1,58 +1,150 @@
+import asyncio
 import json
 import os
 import re
+import resource
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datasets import load_dataset
-from ..experiment_core import MetaData, AGENT_TYPE_MAPPING_AIOS, run_inference
+from .._fast_parse import extract_final_answers
+from ..experiment_core import MetaData, get_agent, run_inference, run_inference_async
 from ..utils import get_parser
 
 
+_FINAL_ANSWER_RE = re.compile(r"<FINAL_ANSWER>([\s\S]*?)</FINAL_ANSWER>")
+
+
 def parse_result(result: str):
-    start_idx = result.find("<FINAL_ANSWER>")
-    end_idx = result.find("</FINAL_ANSWER>")
-    if start_idx != -1 and end_idx != -1:
-        result = result[start_idx + len("<FINAL_ANSWER>"):end_idx]
+    match = _FINAL_ANSWER_RE.search(result)
+    return match.group(1) if match else ""
+
+
+# POSIX guarantees at least 1024 iovec entries per writev call.
+_IOV_MAX = 1024
+
+
+def write_jsonl(records: List, output_file: str):
+    if orjson is not None:
+        chunks = [orjson.dumps(record) + b"\n" for record in records]
+        with open(output_file, "wb", buffering=0) as file:
+            if hasattr(os, "writev"):
+                fd = file.fileno()
+                for i in range(0, len(chunks), _IOV_MAX):
+                    os.writev(fd, chunks[i:i + _IOV_MAX])
+            else:
+                file.writelines(chunks)
     else:
-        result = ""
+        with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+
 
-    return result
+def write_programs_func(program_list: List):
+    path = os.path.join(os.path.dirname(__file__), "programs")
+    os.makedirs(path, exist_ok=True)
+    write_jsonl(
+        [{"task_id": task_id, "program": program} for task_id, program in program_list],
+        os.path.join(path, "programs.jsonl"),
+    )
+    print(f"Write programs num: {len(program_list)}")
 
 
 def write_output_func(result_list: List, output_file: str):
-    with open(output_file, "w", encoding="utf-8") as file:
-        for result in result_list:
-            json_line = json.dumps(result)
-            file.write(json_line + "\n")
-    print(f"Write results num: {len(result_list)}")
+    predictions = [prediction for prediction, _ in result_list]
+    programs = [program for _, program in result_list]
+    write_jsonl(predictions, output_file)
+    write_programs_func(programs)
+    print(f"Write results num: {len(predictions)}")
 
 
-def process_one_func(data, meta_data: MetaData):
-    
-    agent = AGENT_TYPE_MAPPING_AIOS[meta_data.agent_type](meta_data.on_aios)
-    result = agent.run_humaneval(data["prompt"])
-    # breakpoint()
-    result = parse_result(result)
-    # breakpoint()
-    
-    check_program = (
-        data["prompt"]
-        + result
-        + "\n"
-        + data["test"]
-        + "\n"
-        + f"check({data['entry_point']})"
-    )
+def make_prediction(data, result: str):
+    check_program = "".join((
+        data["prompt"],
+        result,
+        "\n",
+        data["test"],
+        "\n",
+        f"check({data['entry_point']})",
+    ))
     task_id = data["task_id"].split("/")[-1]
-    
-    path = os.path.join(os.path.dirname(__file__), "programs")
-    with open(os.path.join(path, f"program{task_id}.py"), "w") as f:
-        f.write(check_program)
 
     prediction = {
         "task_id": data["task_id"],
         "completion": result,
     }
-    return prediction
+    return prediction, (task_id, check_program)
+
+
+def parse_json_result(result: str):
+    try:
+        return json.loads(result)["code"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return ""
+
+
+def process_one_func(data, meta_data: MetaData):
+    agent = get_agent(meta_data.agent_type, meta_data.on_aios)
+    if meta_data.structured:
+        result = parse_json_result(agent.run_humaneval_json(data["prompt"]))
+    else:
+        result = parse_result(agent.run_humaneval(data["prompt"]))
+    return make_prediction(data, result)
+
+
+# Pool and pending futures for overlapping check execution with inference;
+# only set up when the async driver runs with --run_checks. Futures are
+# resolved after inference so a running check never occupies an inference
+# slot under the concurrency semaphore.
+_check_pool = None
+_check_futures = []
+
+
+def _limit_check_resources():
+    resource.setrlimit(resource.RLIMIT_CPU, (10, 10))
+    resource.setrlimit(resource.RLIMIT_AS, (4 << 30, 4 << 30))
+
+
+def run_check_func(task_id: str, check_program: str):
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", check_program],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            preexec_fn=_limit_check_resources,
+        )
+        passed = proc.returncode == 0
+        error = None if passed else proc.stderr[-2000:]
+    except subprocess.TimeoutExpired:
+        passed, error = False, "timeout"
+    return {"task_id": task_id, "passed": passed, "error": error}
+
+
+async def process_one_async(data, meta_data: MetaData):
+    agent = get_agent(meta_data.agent_type, meta_data.on_aios)
+    if meta_data.structured:
+        result = parse_json_result(await agent.arun_humaneval_json(data["prompt"]))
+    else:
+        result = parse_result(await agent.arun_humaneval(data["prompt"]))
+    prediction, program = make_prediction(data, result)
+    if _check_pool is not None:
+        _check_futures.append(_check_pool.submit(run_check_func, *program))
+    return prediction, program
+
+
+def process_batch_func(data_batch: List, meta_data: MetaData):
+    agent = get_agent(meta_data.agent_type, meta_data.on_aios)
+    results = agent.run_humaneval_batch([data["prompt"] for data in data_batch])
+    return [
+        make_prediction(data, completion)
+        for data, completion in zip(data_batch, extract_final_answers(results))
+    ]
 
 
 if __name__ == '__main__':
@@ -68,11 +160,41 @@ if __name__ == '__main__':
         output_file=main_args.output_file,
         on_aios=main_args.on_aios,
         max_num=main_args.max_num,
+        structured=main_args.structured_output,
         # aios_args=vars(main_args),
     )
 
-    run_inference(
-        meta_data=meta,
-        process_one_func=process_one_func,
-        write_output_func=write_output_func,
-    )
\ No newline at end of file
+    if main_args.concurrency is not None:
+        if main_args.run_checks:
+            _check_pool = ProcessPoolExecutor()
+        run_inference_async(
+            meta_data=meta,
+            process_one_async=process_one_async,
+            write_output_func=write_output_func,
+            concurrency=main_args.concurrency,
+        )
+        if _check_pool is not None:
+            check_results = [future.result() for future in _check_futures]
+            _check_pool.shutdown()
+            if check_results:
+                write_jsonl(
+                    check_results,
+                    os.path.join(os.path.dirname(__file__), "check_results.jsonl"),
+                )
+                passed = sum(check["passed"] for check in check_results)
+                print(f"Checks passed: {passed}/{len(check_results)}")
+    elif meta.structured:
+        # The batch query carries no response format, so structured runs go
+        # through the single-sample path
+        run_inference(
+            meta_data=meta,
+            process_one_func=process_one_func,
+            write_output_func=write_output_func,
+        )
+    else:
+        run_inference(
+            meta_data=meta,
+            process_batch_func=process_batch_func,
+            write_output_func=write_output_func,
+            batch_size=main_args.batch_size,
+        )
\ No newline at end of file
@@ -8,4 +8,8 @@ def get_parser():
     parser.add_argument("--output_file", type=str, default="prediction.json")
     parser.add_argument("--on_aios", action="store_true")
     parser.add_argument("--max_num", type=int, default=None)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--structured_output", action="store_true")
+    parser.add_argument("--run_checks", action="store_true")
     return parser
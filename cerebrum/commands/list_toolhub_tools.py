@@ -8,17 +8,45 @@ from rich.box import ROUNDED
 
 import sys
 
+# Shared console so repeated invocations in one process reuse rich's setup
+console = Console()
+
+# Above this many tools, skip rich's per-row layout work and print plain text
+_TABLE_ROW_LIMIT = 200
+
+def _tool_rows(tools):
+    """Extract display rows once, with dict.get pre-bound for the loop."""
+    _get = dict.get
+    rows = []
+    for tool in tools:
+        name = _get(tool, "name", "Unknown")
+        description = _get(tool, "description", "No description available")
+        author = _get(tool, "author", "Unknown")
+        version = _get(tool, "version", "N/A")
+        rows.append((name, description, author, version, f"{author}/{name}"))
+    return rows
+
 def list_toolhub_tools():
-    console = Console()
-    
+    # Kick the network fetch off first so it overlaps console setup
+    tool_manager = ToolManager(config.get_tool_hub_url())
+    tool_manager.prefetch_toolhub_list()
     with console.status("[bold green]Fetching tools from ToolHub..."):
-        tool_manager = ToolManager(config.get_tool_hub_url())
         tools = tool_manager.list_toolhub_tools()
     
     if not tools:
         console.print(Panel("[bold yellow]No tools found in ToolHub", title="Tool List"))
         return
-    
+
+    rows = _tool_rows(tools)
+
+    # Fast path: for large registries, a plain tab-separated dump avoids
+    # rich's measurement/layout pass over every row
+    if len(rows) > _TABLE_ROW_LIMIT:
+        header = ("Name", "Description", "Author", "Latest Version", "How to Call")
+        sys.stdout.write("\n".join("\t".join(row) for row in (header,) + tuple(rows)) + "\n")
+        sys.stdout.write(f"\nTotal tools available: {len(tools)}\n\n")
+        return
+
     # Create a table with row separators and rounded borders
     table = Table(
         title="Available Tools in ToolHub",
@@ -36,14 +64,9 @@ def list_toolhub_tools():
     table.add_column("How to Call", style="green", no_wrap=True)
     
     # Add rows to the table
-    for tool in tools:
-        name = tool.get("name", "Unknown")
-        description = tool.get("description", "No description available")
-        author = tool.get("author", "Unknown")
-        version = tool.get("version", "N/A")
-        id_to_call = f"{author}/{name}"
-        table.add_row(name, description, author, version, id_to_call)
-    
+    for row in rows:
+        table.add_row(*row)
+
     # Print the table
     console.print("\n")  # Add some space before the table
     console.print(table)
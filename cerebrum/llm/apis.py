@@ -1,13 +1,167 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any, Union
+import hashlib
+import json
+
+import requests
+
+from dataclasses import dataclass, fields
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Any, Union
 from typing_extensions import Literal
 
-from cerebrum.utils.communication import Query, Response, send_request
+from cerebrum.utils.communication import (
+    Query,
+    Response,
+    post,
+    send_request,
+    asend_request,
+    send_request_stream,
+    asend_request_stream,
+)
 
 from cerebrum.config.config_manager import config
 
+from cerebrum.llm.cache import LLMCache
+
 aios_kernel_url = config.get_kernel_url()
 
+llm_cache = LLMCache()
+
+def _deterministic_cache_key(query: "LLMQuery") -> Optional[str]:
+    """
+    Return a cache key for queries whose response is reproducible.
+
+    When an explicit llms config is given the kernel samples with the
+    per-LLM settings, so the query is deterministic when every entry sets
+    temperature 0; without one the query's own temperature decides.
+    Non-deterministic queries return None and bypass the cache entirely.
+    """
+    llms = query.llms
+    if llms:
+        if any(cfg.get("temperature") != 0 for cfg in llms):
+            return None
+    elif query.temperature != 0:
+        return None
+    return LLMCache.cache_key(
+        llms, query.messages, query.tools or query.tools_id, query.action_type
+    )
+
+_TOOLS_REGISTRY: Dict[str, List[Dict[str, Any]]] = {}
+_tools_registry_supported = True
+
+def _intern_tools(agent_name: str, tools: Optional[List[Dict[str, Any]]], base_url: str):
+    """
+    Register a tool list with the kernel once per process.
+
+    Tool schemas are static across an agent run but are re-serialized and
+    re-transmitted on every call. This helper hashes the list, registers it
+    under that id on first sight, and afterwards returns only the id so each
+    query ships ~64 bytes instead of the full schemas.
+
+    Returns a (tools, tools_id) pair: (None, id) once the list is interned,
+    or (tools, None) when there is nothing to intern or the kernel does not
+    expose the registry endpoint.
+    """
+    global _tools_registry_supported
+    if not tools or not _tools_registry_supported:
+        return tools, None
+    tools_id = hashlib.sha256(
+        json.dumps(tools, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    if tools_id not in _TOOLS_REGISTRY:
+        try:
+            post(base_url, "/register_tools", {
+                'agent_name': agent_name,
+                'tools_id': tools_id,
+                'tools': tools})
+        except requests.exceptions.HTTPError as e:
+            # Only a missing endpoint proves the kernel lacks the registry;
+            # anything else is treated as transient and this call just
+            # falls back to inline schemas
+            if e.response is not None and e.response.status_code in (404, 405):
+                _tools_registry_supported = False
+            return tools, None
+        except requests.exceptions.RequestException:
+            return tools, None
+        _TOOLS_REGISTRY[tools_id] = tools
+    return None, tools_id
+
+def _send_tool_query(
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
+        llms: Optional[List[Dict[str, Any]]],
+        action_type: str,
+        base_url: str,
+        sender,
+        temperature: float = 1.0
+    ):
+    """
+    Send a tool query with interned schemas, retrying inline on rejection.
+
+    When the kernel rejects a query that carried only a tools_id (e.g. it
+    lost its registry in a restart), the id is dropped from the local
+    registry so the next call re-registers, and this call is retried with
+    the full schemas inline.
+    """
+    interned_tools, tools_id = _intern_tools(agent_name, tools, base_url)
+    query = LLMQuery(
+        llms=llms,
+        messages=messages,
+        tools=interned_tools,
+        tools_id=tools_id,
+        action_type=action_type,
+        temperature=temperature
+    )
+    if tools_id is None:
+        return sender(agent_name, query, base_url)
+    try:
+        return sender(agent_name, query, base_url)
+    except requests.exceptions.HTTPError:
+        _TOOLS_REGISTRY.pop(tools_id, None)
+        query = LLMQuery(
+            llms=llms,
+            messages=messages,
+            tools=tools,
+            action_type=action_type,
+            temperature=temperature
+        )
+        return sender(agent_name, query, base_url)
+
+def _prefix_id_for(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Derive a stable prefix identifier from the system message, if any.
+
+    Requests that share a system prompt (e.g. every sample of a benchmark
+    run) get the same prefix_id, letting prefix-caching backends reuse the
+    KV blocks of the shared prefix instead of re-prefilling it per request.
+    """
+    for message in messages:
+        if message.get("role") == "system":
+            content = message.get("content")
+            if isinstance(content, str):
+                return hashlib.sha256(content.encode("utf-8")).hexdigest()
+            break
+    return None
+
+def _send_request_cached(agent_name: str, query: "LLMQuery", base_url: str):
+    """
+    Send a query through the process-wide `llm_cache`.
+
+    On an exact match of the serialized query the cached kernel response is
+    returned without any network round trip; otherwise the query is forwarded
+    to `send_request` and the response is recorded for next time.
+    """
+    key = _deterministic_cache_key(query)
+    if key is not None:
+        cached = llm_cache.get(key)
+        if cached is not None:
+            return cached
+    response = send_request(agent_name, query, base_url)
+    if key is not None:
+        llm_cache.set(key, response)
+    return response
+
 class LLMQuery(Query):
     """
     Query class for LLM operations.
@@ -88,7 +242,24 @@ class LLMQuery(Query):
                     "strict": true
                 }
             }
-    
+        response_schema: Optional bare JSON schema the response must satisfy,
+            for backends whose structured-output mode takes the schema
+            directly rather than wrapped in a response_format envelope
+        cache_control: Optional provider-style prompt-cache hints (e.g.
+            Anthropic's `{"type": "ephemeral"}` entries), forwarded to the
+            backend untouched
+        prefix_id: Optional stable identifier for the shared prompt prefix;
+            computed from the system message by the API helpers so that
+            prefix-caching-capable backends can pin and reuse KV blocks
+            across requests sharing the same prefix
+        stream: Whether the kernel should stream the response back as
+            server-sent events instead of a single blocking payload
+        tools_id: Optional identifier of a tool list previously registered
+            with the kernel; when set, `tools` is omitted and the kernel
+            resolves the schemas from its registry
+        tools_version: Optional version of the registered tool list, for
+            kernels that keep multiple revisions per tools_id
+
     Examples:
         ```python
         # Simple chat query
@@ -148,11 +319,92 @@ class LLMQuery(Query):
     action_type: Literal["chat", "chat_with_json_output", "chat_with_tool_call_output", "call_tool", "operate_file"] = Field(default="chat")
     temperature: float = Field(default=1.0)
     max_new_tokens: int = Field(default=1000)
-    message_return_type: Literal["text", "json"] = Field(default="text")
+    message_return_type: Literal["text", "json", "json_schema"] = Field(default="text")
     response_format: Optional[Dict[str, Any]] = Field(default=None)
+    response_schema: Optional[Dict[str, Any]] = Field(default=None)
+    cache_control: Optional[List[Dict[str, Any]]] = Field(default=None)
+    prefix_id: Optional[str] = Field(default=None)
+    stream: bool = Field(default=False)
+    tools_id: Optional[str] = Field(default=None)
+    tools_version: Optional[int] = Field(default=None)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+@dataclass(slots=True)
+class FastLLMQuery:
+    """
+    Validation-free counterpart of LLMQuery for hot paths.
+
+    Plain slotted dataclass with the same field layout as LLMQuery but no
+    Pydantic validation or per-instance `__dict__`, for tight loops (e.g.
+    benchmark drivers gathering hundreds of in-flight queries) where the
+    field values are already known-good. `model_dump` mirrors the Pydantic
+    interface so instances can be passed to `send_request` unchanged.
+    """
+    messages: List[Dict[str, Any]]
+    llms: Optional[List[Dict[str, Any]]] = None
+    tools: Optional[List[Dict[str, Any]]] = None
+    action_type: str = "chat"
+    temperature: float = 1.0
+    max_new_tokens: int = 1000
+    message_return_type: str = "text"
+    response_format: Optional[Dict[str, Any]] = None
+    response_schema: Optional[Dict[str, Any]] = None
+    cache_control: Optional[List[Dict[str, Any]]] = None
+    prefix_id: Optional[str] = None
+    stream: bool = False
+    tools_id: Optional[str] = None
+    tools_version: Optional[int] = None
+    query_class: str = "llm"
 
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def model_dump(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+class LLMBatchQuery(Query):
+    """
+    Query class for batched LLM operations.
+
+    This class packages several independent message lists into a single request
+    so that the kernel receives one payload instead of one HTTP round trip per
+    prompt. Backends that support continuous batching (e.g. vLLM) can schedule
+    the whole batch together.
+
+    Attributes:
+        query_class: Identifier for LLM queries, always set to "llm"
+        llms: Optional list of LLM configurations, same format as LLMQuery.llms
+        messages_batch: List of message lists; each inner list follows the same
+            format as LLMQuery.messages and is completed independently
+        action_type: Type of action to perform on each entry, currently "chat"
+        temperature: Sampling temperature applied to every entry
+        max_new_tokens: Maximum tokens to generate per entry
+        message_return_type: Desired format of each response
+        prefix_id: Optional stable identifier for the prompt prefix shared by
+            all entries, same semantics as LLMQuery.prefix_id
+
+    Examples:
+        ```python
+        query = LLMBatchQuery(
+            messages_batch=[
+                [{"role": "user", "content": "What is Python?"}],
+                [{"role": "user", "content": "What is Rust?"}],
+            ],
+            action_type="chat"
+        )
+        ```
+    """
+    query_class: str = "llm"
+    llms: Optional[List[Dict[str, Any]]] = Field(default=None)
+    messages_batch: List[List[Dict[str, Union[str, Any]]]]
+    action_type: Literal["chat"] = Field(default="chat")
+    temperature: float = Field(default=1.0)
+    max_new_tokens: int = Field(default=1000)
+    message_return_type: Literal["text", "json"] = Field(default="text")
+    prefix_id: Optional[str] = Field(default=None)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
 class LLMResponse(Response):
     """
@@ -205,14 +457,14 @@ class LLMResponse(Response):
     error: Optional[str] = None
     status_code: int = 200
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
 def llm_chat(
-        agent_name: str, 
-        messages: List[Dict[str, Any]], 
+        agent_name: str,
+        messages: List[Dict[str, Any]],
         base_url: str = aios_kernel_url,
-        llms: List[Dict[str, Any]] = None
+        llms: List[Dict[str, Any]] = None,
+        temperature: float = 1.0
     ) -> LLMResponse:
     """
     Perform a chat interaction with the LLM.
@@ -229,10 +481,12 @@ def llm_chat(
             ]
         base_url: API base URL
         llms: Optional list of LLM configurations
-        
+        temperature: Sampling temperature; at 0 the response is
+            deterministic and eligible for the local response cache
+
     Returns:
         LLMResponse containing the generated response
-        
+
     Examples:
         ```python
         response = llm_chat(
@@ -258,16 +512,187 @@ def llm_chat(
         llms=llms,
         messages=messages,
         tools=None,
-        action_type="chat"
+        action_type="chat",
+        temperature=temperature,
+        prefix_id=_prefix_id_for(messages)
+    )
+    return _send_request_cached(agent_name, query, base_url)
+
+async def allm_chat(
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        base_url: str = aios_kernel_url,
+        llms: List[Dict[str, Any]] = None
+    ) -> LLMResponse:
+    """
+    Perform a chat interaction with the LLM asynchronously.
+
+    This is the coroutine counterpart of `llm_chat`: the query is identical,
+    but the HTTP round trip is awaited instead of blocking, so callers can
+    overlap many chat requests with `asyncio.gather`. The query is built as
+    a FastLLMQuery — the fields are constructed in-process from known-good
+    values, so Pydantic validation is skipped on this hot path.
+
+    Args:
+        agent_name: Name of the agent making the request
+        messages: List of message dictionaries, same format as `llm_chat`
+        base_url: API base URL
+        llms: Optional list of LLM configurations
+
+    Returns:
+        LLMResponse containing the generated response
+
+    Examples:
+        ```python
+        responses = await asyncio.gather(*[
+            allm_chat("agent1", [{"role": "user", "content": prompt}])
+            for prompt in prompts
+        ])
+        ```
+    """
+    query = FastLLMQuery(
+        llms=llms,
+        messages=messages,
+        tools=None,
+        action_type="chat",
+        prefix_id=_prefix_id_for(messages)
+    )
+    return await asend_request(agent_name, query, base_url)
+
+def llm_chat_stream(
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        base_url: str = aios_kernel_url,
+        llms: List[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+    """
+    Perform a chat interaction with the LLM, streaming the response.
+
+    The kernel emits server-sent events while tokens are still being
+    generated, so the first chunk arrives after one round trip plus prefill
+    instead of after the full completion. Callers can parse the output
+    incrementally and stop consuming early (e.g. once a closing tag such as
+    `</FINAL_ANSWER>` has been seen).
+
+    Args:
+        agent_name: Name of the agent making the request
+        messages: List of message dictionaries, same format as `llm_chat`
+        base_url: API base URL
+        llms: Optional list of LLM configurations
+
+    Yields:
+        Decoded SSE data payload strings, in generation order
+
+    Examples:
+        ```python
+        for chunk in llm_chat_stream("agent1", messages):
+            print(chunk, end="", flush=True)
+        ```
+    """
+    query = LLMQuery(
+        llms=llms,
+        messages=messages,
+        tools=None,
+        action_type="chat",
+        prefix_id=_prefix_id_for(messages),
+        stream=True
+    )
+    yield from send_request_stream(agent_name, query, base_url)
+
+async def allm_chat_stream(
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        base_url: str = aios_kernel_url,
+        llms: List[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+    """
+    Perform a chat interaction with the LLM, streaming the response
+    asynchronously.
+
+    This is the coroutine counterpart of `llm_chat_stream`: chunks are
+    awaited instead of blocking, so several streams can be consumed
+    concurrently.
+
+    Args:
+        agent_name: Name of the agent making the request
+        messages: List of message dictionaries, same format as `llm_chat`
+        base_url: API base URL
+        llms: Optional list of LLM configurations
+
+    Yields:
+        Decoded SSE data payload strings, in generation order
+
+    Examples:
+        ```python
+        async for chunk in allm_chat_stream("agent1", messages):
+            print(chunk, end="", flush=True)
+        ```
+    """
+    query = LLMQuery(
+        llms=llms,
+        messages=messages,
+        tools=None,
+        action_type="chat",
+        prefix_id=_prefix_id_for(messages),
+        stream=True
+    )
+    async for payload in asend_request_stream(agent_name, query, base_url):
+        yield payload
+
+def llm_chat_batch(
+        agent_name: str,
+        messages_batch: List[List[Dict[str, Any]]],
+        base_url: str = aios_kernel_url,
+        llms: List[Dict[str, Any]] = None
+    ) -> List[LLMResponse]:
+    """
+    Perform several independent chat interactions with the LLM in one request.
+
+    All message lists are shipped to the kernel in a single payload, so the
+    per-request HTTP overhead is paid once per batch instead of once per
+    prompt. The kernel returns one response per entry, in order.
+
+    Args:
+        agent_name: Name of the agent making the request
+        messages_batch: List of message lists; each inner list has the same
+            format as the `messages` argument of `llm_chat` and is completed
+            independently of the others
+        base_url: API base URL
+        llms: Optional list of LLM configurations applied to every entry
+
+    Returns:
+        List of LLMResponse objects, one per entry of `messages_batch`
+
+    Examples:
+        ```python
+        responses = llm_chat_batch(
+            "agent1",
+            messages_batch=[
+                [{"role": "user", "content": "Explain quantum computing."}],
+                [{"role": "user", "content": "Explain general relativity."}],
+            ],
+            llms=[{
+                "name": "gpt-4o-mini",
+                "backend": "openai"
+            }]
+        )
+        ```
+    """
+    query = LLMBatchQuery(
+        llms=llms,
+        messages_batch=messages_batch,
+        action_type="chat",
+        prefix_id=_prefix_id_for(messages_batch[0]) if messages_batch else None
     )
     return send_request(agent_name, query, base_url)
 
 def llm_chat_with_json_output(
-        agent_name: str, 
-        messages: List[Dict[str, Any]], 
+        agent_name: str,
+        messages: List[Dict[str, Any]],
         base_url: str = aios_kernel_url,
         llms: List[Dict[str, Any]] = None,
-        response_format: Dict[str, Dict] = None
+        response_format: Dict[str, Dict] = None,
+        response_schema: Dict[str, Any] = None
     ) -> LLMResponse:
     """
     Perform a chat interaction with the LLM and return a JSON-formatted output.
@@ -285,7 +710,10 @@ def llm_chat_with_json_output(
         base_url: API base URL
         llms: Optional list of LLM configurations
         response_format: JSON schema specifying the required output format
-        
+        response_schema: Optional bare JSON schema; when given, the query is
+            sent with message_return_type "json_schema" for backends whose
+            structured-output mode takes the schema directly
+
     Returns:
         LLMResponse containing the generated JSON response
         
@@ -324,12 +752,51 @@ def llm_chat_with_json_output(
     query = LLMQuery(
         llms=llms,
         messages=messages,
-        message_return_type="json",
+        message_return_type="json_schema" if response_schema is not None else "json",
         action_type="chat_with_json_output",
-        response_format=response_format
+        response_format=response_format,
+        response_schema=response_schema
     )
     return send_request(agent_name, query, base_url)
 
+async def allm_chat_with_json_output(
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        base_url: str = aios_kernel_url,
+        llms: List[Dict[str, Any]] = None,
+        response_format: Dict[str, Dict] = None,
+        response_schema: Dict[str, Any] = None
+    ) -> LLMResponse:
+    """
+    Perform a chat interaction with JSON-formatted output asynchronously.
+
+    Coroutine counterpart of `llm_chat_with_json_output`: the query is
+    identical, but the HTTP round trip is awaited instead of blocking, so
+    many structured-output requests can be kept in flight concurrently.
+
+    Args:
+        agent_name: Name of the agent making the request
+        messages: List of message dictionaries, same format as `llm_chat`
+        base_url: API base URL
+        llms: Optional list of LLM configurations
+        response_format: JSON schema specifying the required output format
+        response_schema: Optional bare JSON schema; when given, the query is
+            sent with message_return_type "json_schema" for backends whose
+            structured-output mode takes the schema directly
+
+    Returns:
+        LLMResponse containing the generated JSON response
+    """
+    query = LLMQuery(
+        llms=llms,
+        messages=messages,
+        message_return_type="json_schema" if response_schema is not None else "json",
+        action_type="chat_with_json_output",
+        response_format=response_format,
+        response_schema=response_schema
+    )
+    return await asend_request(agent_name, query, base_url)
+
 def llm_chat_with_tool_call_output(
         agent_name: str, 
         messages: List[Dict[str, Any]], 
@@ -403,21 +870,19 @@ def llm_chat_with_tool_call_output(
         )
         ```
     """
-    query = LLMQuery(
-        llms=llms,
-        messages=messages,
-        tools=tools,
-        action_type="chat_with_tool_call_output"
+    return _send_tool_query(
+        agent_name, messages, tools, llms,
+        "chat_with_tool_call_output", base_url, send_request
     )
-    return send_request(agent_name, query, base_url)
 
 
 def llm_call_tool(
-        agent_name: str, 
-        messages: List[Dict[str, Any]], 
-        tools: List[Dict[str, Any]], 
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
         base_url: str = aios_kernel_url,
-        llms: List[Dict[str, Any]] = None
+        llms: List[Dict[str, Any]] = None,
+        temperature: float = 1.0
     ) -> LLMResponse:
     """
     Use LLM to call tools based on user input.
@@ -485,20 +950,18 @@ def llm_call_tool(
         )
         ```
     """
-    query = LLMQuery(
-        llms=llms,
-        messages=messages,
-        tools=tools,
-        action_type="call_tool"
+    return _send_tool_query(
+        agent_name, messages, tools, llms,
+        "call_tool", base_url, _send_request_cached, temperature=temperature
     )
-    return send_request(agent_name, query, base_url)
 
 def llm_operate_file(
-        agent_name: str, 
-        messages: List[Dict[str, Any]], 
-        tools: List[Dict[str, Any]] = None, 
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]] = None,
         base_url: str = aios_kernel_url,
-        llms: List[Dict[str, Any]] = None
+        llms: List[Dict[str, Any]] = None,
+        temperature: float = 1.0
     ) -> LLMResponse:
     """
     Use LLM to perform file operations.
@@ -515,7 +978,9 @@ def llm_operate_file(
         tools: a list of tools, default as None in this API
         base_url: API base URL
         llms: Optional list of LLM configurations
-        
+        temperature: Sampling temperature; at 0 the response is
+            deterministic and eligible for the local response cache
+
     Returns:
         LLMResponse containing file operation results
         
@@ -542,6 +1007,7 @@ def llm_operate_file(
         llms=llms,
         messages=messages,
         tools=tools,
-        action_type="operate_file"
+        action_type="operate_file",
+        temperature=temperature
     )
-    return send_request(agent_name, query, base_url)
\ No newline at end of file
+    return _send_request_cached(agent_name, query, base_url)
\ No newline at end of file
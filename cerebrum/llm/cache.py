@@ -0,0 +1,91 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class LLMCache:
+    """
+    Content-addressed cache for deterministic LLM queries.
+
+    The cache stores kernel responses keyed on a sha256 digest of the
+    serialized query (llms, messages, tools, action_type), so re-running an
+    identical deterministic query (e.g. an eval sweep with temperature 0) is
+    answered locally instead of hitting the backend again.
+
+    Entries are kept in an OrderedDict used as an LRU: hits move an entry to
+    the most-recently-used end, and inserts beyond `max_size` evict from the
+    least-recently-used end. An optional per-entry TTL (seconds) expires stale
+    responses. All operations are thread-safe.
+
+    Example:
+        ```python
+        cache = LLMCache(max_size=1024, ttl=3600)
+        key = LLMCache.cache_key(llms, messages, tools, "chat")
+        response = cache.get(key)
+        if response is None:
+            response = send_request(agent_name, query)
+            cache.set(key, response)
+        ```
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(
+        llms: Optional[List[Dict[str, Any]]],
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        action_type: str,
+    ) -> str:
+        """Compute a stable sha256 key for the given query content."""
+        payload = json.dumps(
+            {
+                "llms": llms,
+                "messages": messages,
+                "tools": tools,
+                "action_type": action_type,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for `key`, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, evicting LRU entries beyond max_size."""
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMLayer:
     """
     Data class representing the configuration of an LLM processing layer.
@@ -4,6 +4,7 @@ import json
 import base64
 import subprocess
 import sys
+import threading
 from typing import List, Dict, Optional, Tuple
 import requests
 from pathlib import Path
@@ -22,6 +23,7 @@ class ToolManager:
         self.base_path = os.path.dirname(os.path.abspath(__file__))
         self.cache_dir = Path(platformdirs.user_cache_dir("cerebrum_tools"))
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._prefetch = None
 
     def _version_to_path(self, version: str) -> str:
         return version.replace('.', '-')
@@ -286,12 +288,67 @@ class ToolManager:
         finally:
             temp_reqs_path.unlink(missing_ok=True)
 
-    def list_toolhub_tools(self) -> List[Dict[str, str]]:
-        """List all available tools from the remote server."""
-        response = requests.get(f"{self.base_url}/cerebrum/tools/list")
+    def _fetch_toolhub_list(self) -> Dict:
+        """Fetch the raw toolhub listing, revalidating an on-disk ETag cache.
+
+        The cached listing is sent back with If-None-Match; on a 304 the
+        cached copy is served without re-downloading the registry.
+        """
+        cache_file = self.cache_dir / "toolhub_list_cache.json"
+        headers = {}
+        cached = None
+        if cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text())
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+            except (json.JSONDecodeError, OSError):
+                cached = None
+        response = requests.get(f"{self.base_url}/cerebrum/tools/list", headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached["tools"]
         response.raise_for_status()
         tools = response.json()
-        
+        etag = response.headers.get("ETag")
+        if etag:
+            try:
+                cache_file.write_text(json.dumps({"etag": etag, "tools": tools}))
+            except OSError:
+                pass
+        return tools
+
+    def prefetch_toolhub_list(self):
+        """Start fetching the toolhub listing on a background thread.
+
+        Call this as early as possible (e.g. before rendering setup) so the
+        network round trip overlaps local work; the next
+        `list_toolhub_tools` call joins the thread and consumes the result.
+        """
+        outcome = {}
+
+        def _worker():
+            try:
+                outcome["tools"] = self._fetch_toolhub_list()
+            except Exception as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=_worker, daemon=True)
+        thread.start()
+        self._prefetch = (thread, outcome)
+
+    def list_toolhub_tools(self) -> List[Dict[str, str]]:
+        """List all available tools from the remote server."""
+        if self._prefetch is not None:
+            thread, outcome = self._prefetch
+            self._prefetch = None
+            thread.join()
+            if "tools" in outcome:
+                tools = outcome["tools"]
+            else:
+                raise outcome["error"]
+        else:
+            tools = self._fetch_toolhub_list()
+
         # Dictionary to track the latest version of each tool
         latest_tools = {}
         
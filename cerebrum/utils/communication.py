@@ -1,13 +1,63 @@
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
+import asyncio
+import json
+import weakref
+
+import httpx
 import requests
-from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, AsyncIterator, Iterator, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from cerebrum.config.config_manager import config
 
 aios_kernel_url = config.get_kernel_url()
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Module-level session so every request reuses pooled keep-alive connections
+# instead of paying a TCP/TLS handshake per call.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Pooled async clients, one per event loop: connections are bound to the loop
+# they were opened on, so a single module-level client would break across
+# successive asyncio.run calls. The mapping is weak on the loop so an entry
+# disappears with its loop, and a finalizer closes the orphaned client.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary())
+
+def _close_async_client(client: httpx.AsyncClient) -> None:
+    # Best effort: the loop the client lived on is gone, so close it on a
+    # throwaway loop to release sockets rather than leaking them.
+    try:
+        asyncio.run(client.aclose())
+    except Exception:
+        pass
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=None)
+        _async_clients[loop] = client
+        weakref.finalize(loop, _close_async_client, client)
+    return client
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a request body straight to bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
 class Query(BaseModel):
     """
     Base class for all query types in the AIOS system.
@@ -51,10 +101,155 @@ def post(base_url: str, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         requests.exceptions.HTTPError: If the request fails
     """
-    response = requests.post(f"{base_url}{endpoint}", json=data)
+    response = _session.post(f"{base_url}{endpoint}", data=_encode_json(data), headers=_JSON_HEADERS)
     response.raise_for_status()
     return response.json()
 
+def post_stream(base_url: str, endpoint: str, data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Send a POST request and yield server-sent event (SSE) payloads as they
+    arrive.
+
+    Each yielded item is the content of one `data: ...` line with the prefix
+    stripped; the `[DONE]` sentinel terminates the stream and is not yielded.
+
+    Args:
+        base_url: Base URL of the API server
+        endpoint: API endpoint path
+        data: JSON-serializable dictionary to be sent in the request body
+
+    Yields:
+        SSE data payload strings, in arrival order
+
+    Raises:
+        requests.exceptions.HTTPError: If the request fails
+    """
+    with _session.post(f"{base_url}{endpoint}", data=_encode_json(data), headers=_JSON_HEADERS, stream=True) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            yield payload
+
+def send_request_stream(agent_name: str, query: Query, base_url: str = aios_kernel_url) -> Iterator[str]:
+    """
+    Send a query to the AIOS kernel and stream back the response.
+
+    The kernel starts emitting SSE chunks as soon as tokens are generated,
+    so callers can consume (and possibly cancel) the response incrementally
+    instead of waiting for the full completion.
+
+    Args:
+        agent_name: Name of the agent making the request
+        query: Query object containing the request details
+        base_url: Base URL of the AIOS kernel
+
+    Yields:
+        SSE data payload strings from the kernel
+    """
+    query_type = query.query_class
+    yield from post_stream(base_url, "/query", {
+        'query_type': query_type,
+        'agent_name': agent_name,
+        'query_data': query.model_dump()})
+
+async def apost(base_url: str, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send a POST request to the specified API endpoint asynchronously.
+
+    Args:
+        base_url: Base URL of the API server
+        endpoint: API endpoint path
+        data: JSON-serializable dictionary to be sent in the request body
+
+    Returns:
+        Parsed JSON response as a dictionary
+
+    Raises:
+        httpx.HTTPStatusError: If the request fails
+    """
+    client = _get_async_client()
+    response = await client.post(
+        f"{base_url}{endpoint}", content=_encode_json(data), headers=_JSON_HEADERS)
+    response.raise_for_status()
+    return response.json()
+
+async def asend_request(agent_name: str, query: Query, base_url: str = aios_kernel_url):
+    """
+    Send a query to the AIOS kernel on behalf of an agent asynchronously.
+
+    Unlike `send_request`, this coroutine does not block the event loop while
+    waiting on the kernel, so many queries can be kept in flight concurrently
+    (e.g. with `asyncio.gather`).
+
+    Args:
+        agent_name: Name of the agent making the request
+        query: Query object containing the request details
+        base_url: Base URL of the AIOS kernel
+
+    Returns:
+        Parsed JSON response from the AIOS kernel
+    """
+    query_type = query.query_class
+    result = await apost(base_url, "/query", {
+        'query_type': query_type,
+        'agent_name': agent_name,
+        'query_data': query.model_dump()})
+
+    return result
+
+async def apost_stream(base_url: str, endpoint: str, data: Dict[str, Any]) -> AsyncIterator[str]:
+    """
+    Asynchronous counterpart of `post_stream`: POST a request and yield SSE
+    data payloads as they arrive, without blocking the event loop.
+
+    Args:
+        base_url: Base URL of the API server
+        endpoint: API endpoint path
+        data: JSON-serializable dictionary to be sent in the request body
+
+    Yields:
+        SSE data payload strings, in arrival order
+
+    Raises:
+        httpx.HTTPStatusError: If the request fails
+    """
+    client = _get_async_client()
+    async with client.stream(
+            "POST", f"{base_url}{endpoint}", content=_encode_json(data),
+            headers=_JSON_HEADERS) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line or not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            yield payload
+
+async def asend_request_stream(agent_name: str, query: Query, base_url: str = aios_kernel_url) -> AsyncIterator[str]:
+    """
+    Send a query to the AIOS kernel and stream back the response
+    asynchronously.
+
+    Args:
+        agent_name: Name of the agent making the request
+        query: Query object containing the request details
+        base_url: Base URL of the AIOS kernel
+
+    Yields:
+        SSE data payload strings from the kernel
+    """
+    query_type = query.query_class
+    async for payload in apost_stream(base_url, "/query", {
+            'query_type': query_type,
+            'agent_name': agent_name,
+            'query_data': query.model_dump()}):
+        yield payload
+
 def send_request(agent_name: str, query: Query, base_url: str = aios_kernel_url):
     """
     Send a query to the AIOS kernel on behalf of an agent.
@@ -67,10 +262,11 @@ def send_request(agent_name: str, query: Query, base_url: str = aios_kernel_url)
     Returns:
         Parsed JSON response from the AIOS kernel
     """
-    query_type = query.query_class
-    result = post(base_url, "/query", {
-        'query_type': query_type,
+    body = _encode_json({
+        'query_type': query.query_class,
         'agent_name': agent_name,
         'query_data': query.model_dump()})
+    response = _session.post(f"{base_url}/query", data=body, headers=_JSON_HEADERS)
+    response.raise_for_status()
 
-    return result
\ No newline at end of file
+    return response.json()
\ No newline at end of file